@@ -549,7 +549,7 @@ def _transfer(sender: address, receiver: address, amount: uint256):
     # See note on `transfer()`.
 
     # Protect people from accidentally sending their shares to bad places
-    assert not (receiver in [self, ZERO_ADDRESS])
+    assert not (receiver in [self, ZERO_ADDRESS])  # dev: invalid receiver
     self.balanceOf[sender] -= amount
     self.balanceOf[receiver] += amount
     log Transfer(sender, receiver, amount)
@@ -826,7 +826,7 @@ def deposit(_amount: uint256 = MAX_UINT256, recipient: address = msg.sender) ->
         caller's address.
     @return The issued Vault shares.
     """
-    assert not self.emergencyShutdown  # Deposits are locked out
+    assert not self.emergencyShutdown  # dev: deposits are locked out
 
     amount: uint256 = _amount
 
@@ -839,14 +839,14 @@ def deposit(_amount: uint256 = MAX_UINT256, recipient: address = msg.sender) ->
         )
     else:
         # Ensure deposit limit is respected
-        assert self._totalAssets() + amount <= self.depositLimit
+        assert self._totalAssets() + amount <= self.depositLimit  # dev: deposit limit exceeded
 
     # Ensure we are depositing something
-    assert amount > 0
+    assert amount > 0  # dev: nothing to deposit
 
     # Ensure deposit is permitted by guest list
     if self.guestList.address != ZERO_ADDRESS:
-        assert self.guestList.authorized(msg.sender, amount)
+        assert self.guestList.authorized(msg.sender, amount)  # dev: not authorized
 
     # Issue new shares (needs to be done before taking deposit to be accurate)
     # Shares are issued to recipient (may be different from msg.sender)
@@ -948,7 +948,7 @@ def withdraw(_shares: uint256 = MAX_UINT256, recipient: address = msg.sender) ->
         shares = self.balanceOf[msg.sender]
 
     # Limit to only the shares they own
-    assert shares <= self.balanceOf[msg.sender]
+    assert shares <= self.balanceOf[msg.sender]  # dev: insufficient shares
 
     # See @dev note, above.
     value: uint256 = self._shareValue(shares)
@@ -1,79 +1,88 @@
 import brownie
 import pytest
 from brownie import chain
+from eth_abi import encode_abi
 from eth_account import Account
-from eth_account.messages import encode_structured_data
+from eth_utils import keccak
 
 amount = 100
-owner = Account.create()
-spender = Account.create()
+# NOTE: Fixed keys so signatures are the same across runs and xdist workers
+owner = Account.from_key(
+    "0x416b8a7d9290502f5661da81f0cf43893e3d19cb9aea3c426cfb36e8186e9c09"
+)
+spender = Account.from_key(
+    "0x575fae4a0ad9d57f94f56c1c692b33d4294e021b6d8e258a107606f7f5645927"
+)
 
 
-def generate_permit(vault, owner: Account, spender: Account, value, nonce, deadline):
-    name = "Yearn Vault"
-    version = vault.apiVersion()
+DOMAIN_TYPE_HASH = keccak(
+    text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+PERMIT_TYPE_HASH = keccak(
+    text="Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
+)
+
+
+@pytest.fixture
+def domain_separator(vault):
     chain_id = 1  # ganache bug https://github.com/trufflesuite/ganache/issues/1643
-    contract = str(vault)
-    data = {
-        "types": {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
+    yield keccak(
+        encode_abi(
+            ["bytes32", "bytes32", "bytes32", "uint256", "address"],
+            [
+                DOMAIN_TYPE_HASH,
+                keccak(text="Yearn Vault"),
+                keccak(text=vault.apiVersion()),
+                chain_id,
+                str(vault),
             ],
-            "Permit": [
-                {"name": "owner", "type": "address"},
-                {"name": "spender", "type": "address"},
-                {"name": "value", "type": "uint256"},
-                {"name": "nonce", "type": "uint256"},
-                {"name": "deadline", "type": "uint256"},
-            ],
-        },
-        "domain": {
-            "name": name,
-            "version": version,
-            "chainId": chain_id,
-            "verifyingContract": contract,
-        },
-        "primaryType": "Permit",
-        "message": {
-            "owner": owner.address,
-            "spender": spender.address,
-            "value": value,
-            "nonce": nonce,
-            "deadline": deadline,
-        },
-    }
-    return encode_structured_data(data)
+        )
+    )
+
+
+def generate_permit(
+    domain_separator, owner: Account, spender: Account, value, nonce, deadline
+):
+    # NOTE: Same EIP-712 digest as `Vault.permit`, without walking the typed data
+    struct_hash = keccak(
+        encode_abi(
+            ["bytes32", "address", "address", "uint256", "uint256", "uint256"],
+            [PERMIT_TYPE_HASH, owner.address, spender.address, value, nonce, deadline],
+        )
+    )
+    return keccak(b"\x19\x01" + domain_separator + struct_hash)
+
+
+def test_domain_separator(vault, domain_separator):
+    assert bytes(vault.DOMAIN_SEPARATOR()) == domain_separator
 
 
 @pytest.mark.parametrize("expiry", [True, False])
-def test_permit(vault, expiry):
+def test_permit(vault, domain_separator, expiry):
     nonce = vault.nonces(owner.address)
     expiry = chain[-1].timestamp + 3600 if expiry else 0
-    permit = generate_permit(vault, owner, spender, amount, nonce, expiry)
-    signature = owner.sign_message(permit).signature
+    permit = generate_permit(domain_separator, owner, spender, amount, nonce, expiry)
+    signature = owner.signHash(permit).signature
     assert vault.allowance(owner.address, spender.address) == 0
     vault.permit(owner.address, spender.address, amount, expiry, signature)
     assert vault.allowance(owner.address, spender.address) == amount
 
 
-def test_permit_wrong_signature(vault):
+def test_permit_wrong_signature(vault, domain_separator):
     nonce = vault.nonces(owner.address)
     expiry = 0
-    permit = generate_permit(vault, owner, spender, amount, nonce, expiry)
-    signature = spender.sign_message(permit).signature
+    permit = generate_permit(domain_separator, owner, spender, amount, nonce, expiry)
+    signature = spender.signHash(permit).signature
     assert vault.allowance(owner.address, spender.address) == 0
     with brownie.reverts("dev: invalid signature"):
         vault.permit(owner.address, spender.address, amount, expiry, signature)
 
 
-def test_permit_expired(vault):
+def test_permit_expired(vault, domain_separator):
     nonce = vault.nonces(owner.address)
     expiry = chain[-1].timestamp - 600
-    permit = generate_permit(vault, owner, spender, amount, nonce, expiry)
-    signature = owner.sign_message(permit).signature
+    permit = generate_permit(domain_separator, owner, spender, amount, nonce, expiry)
+    signature = owner.signHash(permit).signature
     assert vault.allowance(owner.address, spender.address) == 0
     with brownie.reverts("dev: permit expired"):
         vault.permit(owner.address, spender.address, amount, expiry, signature)
@@ -1,33 +1,60 @@
 import pytest
 import brownie
 
+MAX_UINT256 = 2 ** 256 - 1
 
-@pytest.fixture
+
+# NOTE: These fixtures are module scoped so the contracts are only deployed once
+#       per module, `shared_setup` reverts the chain back to this state after
+#       every test.
+@pytest.fixture(scope="module")
+def gov(accounts):
+    yield accounts[0]
+
+
+@pytest.fixture(scope="module")
+def token(gov, Token):
+    yield gov.deploy(Token)
+
+
+@pytest.fixture(scope="module")
+def one_share(token):
+    # Price of 1 share when the vault has no returns (1:1 with token)
+    yield 10 ** token.decimals()
+
+
+@pytest.fixture(scope="module")
 def vault(gov, token, Vault):
     # NOTE: Overriding the one in conftest because it has values already
     vault = gov.deploy(Vault)
     vault.initialize(
         token, gov, gov, token.symbol() + " yVault", "yv" + token.symbol(), gov
     )
-    vault.setDepositLimit(2 ** 256 - 1, {"from": gov})
+    vault.setDepositLimit(MAX_UINT256, {"from": gov})
     yield vault
 
 
-@pytest.fixture
+@pytest.fixture(scope="module", autouse=True)
+def approve_vault(accounts, token, vault):
+    # Every account gives the vault an unlimited allowance up front, so the
+    # tests don't have to approve before each deposit
+    for account in accounts:
+        token.approve(vault, MAX_UINT256, {"from": account})
+
+
+@pytest.fixture(scope="module")
 def guest_list(gov, TestGuestList):
     yield gov.deploy(TestGuestList)
 
 
 def test_deposit_with_zero_funds(vault, token, rando):
     assert token.balanceOf(rando) == 0
-    token.approve(vault, 2 ** 256 - 1, {"from": rando})
-    with brownie.reverts():
+    with brownie.reverts("dev: nothing to deposit"):
         vault.deposit({"from": rando})
 
 
 def test_deposit_with_wrong_amount(vault, token, gov):
     balance = token.balanceOf(gov) + 1
-    token.approve(vault, 2 ** 256 - 1, {"from": gov})
     with brownie.reverts():
         vault.deposit(balance, {"from": gov})
 
@@ -36,7 +63,6 @@ def test_deposit_with_guest_list(vault, guest_list, token, gov, rando, history):
     # Make sure we're attempting to deposit something
     token.transfer(rando, token.balanceOf(gov) // 2, {"from": gov})
     balance = token.balanceOf(rando)
-    token.approve(vault, balance, {"from": rando})
 
     # Note - don't need to call guest_list.setGuests, since nobody's invited by
     # default.
@@ -44,7 +70,7 @@ def test_deposit_with_guest_list(vault, guest_list, token, gov, rando, history):
     vault.setGuestList(guest_list, {"from": gov})
 
     # Ensure rando's not permitted to deposit
-    with brownie.reverts():
+    with brownie.reverts("dev: not authorized"):
         vault.deposit(balance, {"from": rando})
 
     # Ensure authorized was called and that the deposit didn't revert for a
@@ -65,74 +91,60 @@ def test_deposit_with_guest_list(vault, guest_list, token, gov, rando, history):
     assert vault.balanceOf(rando) == balance
 
 
-def test_deposit_all_and_withdraw_all(gov, vault, token):
+# NOTE: The first deposit is half the balance, either passed explicitly or
+#       taken without the integer arg up to the deposit limit
+@pytest.mark.parametrize("explicit", [True, False])
+def test_deposit_withdraw(gov, vault, token, one_share, explicit):
     balance = token.balanceOf(gov)
-    token.approve(vault, token.balanceOf(gov), {"from": gov})
+    amount = balance // 2
 
-    # Take up the rest of the deposit limit only
-    vault.setDepositLimit(token.balanceOf(gov) // 2, {"from": gov})
-    vault.deposit({"from": gov})
-    # vault has tokens
-    assert token.balanceOf(vault) == balance // 2
-    # sender has vault shares
-    assert vault.balanceOf(gov) == balance // 2
+    if explicit:
+        vault.deposit(amount, {"from": gov})
+    else:
+        # Take up the rest of the deposit limit only
+        vault.setDepositLimit(amount, {"from": gov})
+        vault.deposit({"from": gov})
+        vault.setDepositLimit(MAX_UINT256, {"from": gov})
 
-    # When deposit limit is lifted, deposit everything
-    vault.setDepositLimit(2 ** 256 - 1, {"from": gov})
-    vault.deposit({"from": gov})
     # vault has tokens
-    assert token.balanceOf(vault) == balance
+    assert token.balanceOf(vault) == amount
     # sender has vault shares
-    assert vault.balanceOf(gov) == balance
-
-    vault.withdraw({"from": gov})
-    # vault no longer has tokens
-    assert token.balanceOf(vault) == 0
-    # sender no longer has shares
-    assert vault.balanceOf(gov) == 0
-    # sender has tokens
-    assert token.balanceOf(gov) == balance
-
-
-def test_deposit_withdraw(gov, vault, token):
-    balance = token.balanceOf(gov)
-    token.approve(vault, balance, {"from": gov})
-    vault.deposit(balance // 2, {"from": gov})
-
-    assert token.balanceOf(vault) == balance // 2
+    assert vault.balanceOf(gov) == amount
     assert vault.totalDebt() == 0
-    assert vault.pricePerShare() == 10 ** token.decimals()  # 1:1 price
+    assert vault.pricePerShare() == one_share  # 1:1 price
 
     # Do it twice to test behavior when it has shares
     vault.deposit({"from": gov})
 
     assert vault.totalSupply() == token.balanceOf(vault) == balance
     assert vault.totalDebt() == 0
-    assert vault.pricePerShare() == 10 ** token.decimals()  # 1:1 price
+    assert vault.pricePerShare() == one_share  # 1:1 price
 
     vault.withdraw(vault.balanceOf(gov) // 2, {"from": gov})
 
     assert token.balanceOf(vault) == balance // 2
     assert vault.totalDebt() == 0
-    assert vault.pricePerShare() == 10 ** token.decimals()  # 1:1 price
+    assert vault.pricePerShare() == one_share  # 1:1 price
 
     # Can't withdraw more shares than we have
-    with brownie.reverts():
+    with brownie.reverts("dev: insufficient shares"):
         vault.withdraw(2 * vault.balanceOf(gov), {"from": gov})
 
     vault.withdraw({"from": gov})
+    # vault no longer has tokens
     assert vault.totalSupply() == token.balanceOf(vault) == 0
     assert vault.totalDebt() == 0
+    # sender no longer has shares
+    assert vault.balanceOf(gov) == 0
+    # sender has tokens
     assert token.balanceOf(gov) == balance
 
 
 def test_deposit_limit(gov, token, vault):
-    token.approve(vault, 2 ** 256 - 1, {"from": gov})
-
     vault.setDepositLimit(0, {"from": gov})
 
     # Deposits are locked out
-    with brownie.reverts():
+    with brownie.reverts("dev: nothing to deposit"):
         vault.deposit({"from": gov})
 
     balance = token.balanceOf(gov)
@@ -143,7 +155,7 @@ def test_deposit_limit(gov, token, vault):
     assert vault.balanceOf(gov) == balance // 3
 
     # With the integer arg, it must be at or below the limit
-    with brownie.reverts():
+    with brownie.reverts("dev: deposit limit exceeded"):
         vault.deposit(token.balanceOf(gov), {"from": gov})
 
     # Without the integer arg, it takes up to whatever's left
@@ -151,10 +163,10 @@ def test_deposit_limit(gov, token, vault):
     assert vault.balanceOf(gov) == balance // 2
 
     # Deposits are locked out
-    with brownie.reverts():
+    with brownie.reverts("dev: nothing to deposit"):
         vault.deposit({"from": gov})
 
-    vault.setDepositLimit(2 ** 256 - 1, {"from": gov})
+    vault.setDepositLimit(MAX_UINT256, {"from": gov})
 
     # Now it will take the rest
     vault.deposit({"from": gov})
@@ -171,8 +183,7 @@ def test_delegated_deposit_withdraw(accounts, token, vault):
     assert originalTokenAmount > 0
 
     # 1. Deposit from a and send shares to b
-    token.approve(vault, token.balanceOf(a), {"from": a})
-    vault.deposit(token.balanceOf(a), b, {"from": a})
+    vault.deposit(originalTokenAmount, b, {"from": a})
 
     # a no longer has any tokens
     assert token.balanceOf(a) == 0
@@ -192,8 +203,7 @@ def test_delegated_deposit_withdraw(accounts, token, vault):
     assert token.balanceOf(c) == originalTokenAmount
 
     # 3. Deposit all from c and send shares to d
-    token.approve(vault, token.balanceOf(c), {"from": c})
-    vault.deposit(token.balanceOf(c), d, {"from": c})
+    vault.deposit(originalTokenAmount, d, {"from": c})
 
     # c no longer has the tokens
     assert token.balanceOf(c) == 0
@@ -213,19 +223,18 @@ def test_delegated_deposit_withdraw(accounts, token, vault):
     assert token.balanceOf(e) == originalTokenAmount
 
 
-def test_emergencyShutdown(gov, vault, token):
+def test_emergencyShutdown(gov, vault, token, one_share):
     balance = token.balanceOf(gov)
-    token.approve(vault, balance, {"from": gov})
     vault.deposit(balance // 2, {"from": gov})
 
     assert token.balanceOf(vault) == balance // 2
     assert vault.totalDebt() == 0
-    assert vault.pricePerShare() == 10 ** token.decimals()  # 1:1 price
+    assert vault.pricePerShare() == one_share  # 1:1 price
 
     vault.setEmergencyShutdown(True, {"from": gov})
 
     # Deposits are locked out
-    with brownie.reverts():
+    with brownie.reverts("dev: deposits are locked out"):
         vault.deposit({"from": gov})
 
     # But withdrawals are fine
@@ -236,18 +245,17 @@ def test_emergencyShutdown(gov, vault, token):
 
 def test_transfer(accounts, token, vault):
     a, b = accounts[0:2]
-    token.approve(vault, token.balanceOf(a), {"from": a})
     vault.deposit({"from": a})
 
     assert vault.balanceOf(a) == token.balanceOf(vault)
     assert vault.balanceOf(b) == 0
 
     # Can't send your balance to the Vault
-    with brownie.reverts():
+    with brownie.reverts("dev: invalid receiver"):
         vault.transfer(vault, vault.balanceOf(a), {"from": a})
 
     # Can't send your balance to the zero address
-    with brownie.reverts():
+    with brownie.reverts("dev: invalid receiver"):
         vault.transfer(
             "0x0000000000000000000000000000000000000000",
             vault.balanceOf(a),
@@ -262,7 +270,6 @@ def test_transfer(accounts, token, vault):
 
 def test_transferFrom(accounts, token, vault):
     a, b, c = accounts[0:3]
-    token.approve(vault, token.balanceOf(a), {"from": a})
     vault.deposit({"from": a})
 
     # Unapproved can't send
@@ -291,8 +298,10 @@ def test_transferFrom(accounts, token, vault):
     assert vault.balanceOf(b) == token.balanceOf(vault) // 2
 
     # If approval is unlimited, little bit of a gas savings
-    vault.approve(c, 2 ** 256 - 1, {"from": a})
+    vault.approve(c, MAX_UINT256, {"from": a})
     vault.transferFrom(a, b, vault.balanceOf(a), {"from": c})
+    # Unlimited approval is not decremented
+    assert vault.allowance(a, c) == MAX_UINT256
 
     assert vault.balanceOf(a) == 0
     assert vault.balanceOf(b) == token.balanceOf(vault)